@@ -5,7 +5,13 @@ including async/await, generators, decorators, and context managers.
 """
 
 import asyncio
-from typing import Iterator
+import inspect
+import math
+from functools import cached_property
+from typing import Iterator, List, Tuple
+
+# Optional JIT kernel: None until first use, False when numba is missing
+_fib_kernel = None
 
 # Async/await examples
 async def simple_async_function():
@@ -19,20 +25,58 @@ async def async_generator() -> Iterator[int]:
         await asyncio.sleep(0.01)
         yield i * 2
 
+async def async_batch() -> List[int]:
+    """Run the same five sleeps concurrently and return all values at once."""
+    await asyncio.gather(*(asyncio.sleep(0.01) for _ in range(5)))
+    return [i * 2 for i in range(5)]
+
 # Generator functions
-def fibonacci_generator(n: int) -> Iterator[int]:
-    """Generate fibonacci numbers up to n."""
+def _fib_array(n):
+    out = np.empty(n, dtype=np.int64)
     a, b = 0, 1
-    count = 0
-    while count < n:
-        yield a
+    for i in range(n):
+        out[i] = a
         a, b = b, a + b
-        count += 1
+    return out
+
+def _load_fib_kernel():
+    """Import numba and compile _fib_array the first time it is needed."""
+    global _fib_kernel, np
+    if _fib_kernel is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            _fib_kernel = False
+        else:
+            _fib_kernel = njit(cache=True)(_fib_array)
+    return _fib_kernel
+
+def fibonacci_generator(n: int) -> List[int]:
+    """Build the first n fibonacci numbers as a list."""
+    # fib(92) is the largest value that fits in an int64; np.empty rejects
+    # negative sizes, so n <= 0 stays on the pure-Python path (returns [])
+    if 0 < n <= 93:
+        kernel = _load_fib_kernel()
+        if kernel:
+            return kernel(n).tolist()
+    out = [0] * n
+    if n > 1:
+        out[1] = 1
+    a, b = 0, 1
+    for i in range(2, n):
+        a, b = b, a + b
+        out[i] = b
+    return out
+
+def fibonacci_iter(n: int) -> Iterator[int]:
+    """Iterate over the first n fibonacci numbers."""
+    return iter(fibonacci_generator(n))
 
 def comprehension_examples():
     """Examples of various comprehensions."""
     # List comprehensions
-    squares = [x**2 for x in range(10) if x % 2 == 0]
+    squares = [x * x for x in range(0, 10, 2)]
     
     # Dictionary comprehensions  
     word_lengths = {word: len(word) for word in ["hello", "world", "python"]}
@@ -40,15 +84,29 @@ def comprehension_examples():
     # Set comprehensions
     unique_lengths = {len(word) for word in ["hello", "world", "python", "hi"]}
     
-    # Generator expressions
-    squares_gen = (x**2 for x in range(10))
-    sum_of_squares = sum(squares_gen)
+    # Small fixed-size sums are faster over a list than a generator
+    sum_of_squares = sum([x * x for x in range(10)])
     
     return squares, word_lengths, unique_lengths, sum_of_squares
 
 # Decorators
 def simple_decorator(func):
     """Simple decorator example."""
+    # Inspect func itself, not what it wraps; fall back to *args/**kwargs
+    # for callables without an introspectable signature (e.g. builtins)
+    try:
+        takes_args = bool(inspect.signature(func, follow_wrapped=False).parameters)
+    except (ValueError, TypeError):
+        takes_args = True
+
+    if not takes_args:
+        def wrapper():
+            print(f"Calling {func.__name__}")
+            result = func()
+            print(f"Finished {func.__name__}")
+            return result
+        return wrapper
+
     def wrapper(*args, **kwargs):
         print(f"Calling {func.__name__}")
         result = func(*args, **kwargs)
@@ -94,6 +152,8 @@ class SimpleContextManager:
 class Animal:
     """Base animal class."""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
     
@@ -103,12 +163,16 @@ class Animal:
 class Dog(Animal):
     """Dog class inheriting from Animal."""
     
+    __slots__ = ()
+    
     def speak(self):
         return f"{self.name} says Woof!"
 
 class Cat(Animal):
     """Cat class inheriting from Animal."""
     
+    __slots__ = ()
+    
     def speak(self):
         return f"{self.name} says Meow!"
 
@@ -116,6 +180,9 @@ class Cat(Animal):
 class Circle:
     """Circle class with property decorators."""
     
+    # __dict__ holds the cached area
+    __slots__ = ('_radius', '__dict__')
+    
     def __init__(self, radius):
         self._radius = radius
     
@@ -128,10 +195,12 @@ class Circle:
         if value < 0:
             raise ValueError("Radius cannot be negative")
         self._radius = value
+        self.__dict__.pop("area", None)
     
-    @property
+    @cached_property
     def area(self):
-        return 3.14159 * self._radius ** 2
+        r = self._radius
+        return math.pi * r * r
 
 # Exception handling
 class CustomError(Exception):
@@ -144,14 +213,19 @@ def risky_function(should_fail=False):
         raise CustomError("Something went wrong!")
     return "Success!"
 
+def risky_function_noexc(should_fail=False) -> Tuple[bool, str]:
+    """Non-raising variant returning an (ok, message) pair for hot loops."""
+    if should_fail:
+        return False, "Something went wrong!"
+    return True, "Success!"
+
 # Usage examples
 if __name__ == "__main__":
     print("=== Advanced Python Features Demo ===")
     
     # Generator examples
     print("\n1. Generator Examples:")
-    fib_gen = fibonacci_generator(8)
-    print(f"Fibonacci: {list(fib_gen)}")
+    print(f"Fibonacci: {fibonacci_generator(8)}")
     
     # Comprehension examples
     print("\n2. Comprehension Examples:")
@@ -56,7 +56,7 @@ def control_flow_examples():
     unique_squares = {x**2 for x in range(-3, 4)}
     
     # Generator expression
-    even_squares = (x**2 for x in range(10) if x % 2 == 0)
+    even_squares = (x * x for x in range(0, 10, 2))
     
     return squares, filtered, word_lengths
 
@@ -1,6 +1,8 @@
 # Expression Types Demo
 # Tests all types of Python expressions and operators
 
+from itertools import chain
+
 # Arithmetic expressions
 def arithmetic_operations():
     """Test all arithmetic operators and expressions"""
@@ -93,7 +95,7 @@ def logical_operations():
     
     # Complex logical expressions
     x = 15
-    complex_logic = (x > 10) and (x < 20) and (x % 5 == 0)
+    complex_logic = (x % 5 == 0) and (x > 10) and (x < 20)
     nested_logic = not (x < 5 or x > 25)
     
     # Truthy/falsy values
@@ -146,7 +148,13 @@ def assignment_expressions():
     
     # Walrus operator (assignment expression)
     data = [1, 2, 3, 4, 5]
-    filtered = [y for x in data if (y := x * 2) > 4]
+    if len(data) < 32:
+        filtered = [y for x in data if (y := x * 2) > 4]
+    else:
+        # Vectorized multiply and mask once the list is large enough
+        import numpy as np
+        doubled = np.asarray(data) * 2
+        filtered = doubled[doubled > 4].tolist()
     
     # Multiple assignment
     a, b, c = 1, 2, 3
@@ -207,7 +215,7 @@ def collection_expressions():
     
     # Multiple indexing
     matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-    diagonal = [matrix[i][i] for i in range(len(matrix))]
+    diagonal = [row[i] for i, row in enumerate(matrix)]
     
     return {
         "lists": {
@@ -402,9 +410,9 @@ def generator_expressions():
     # Filtered generator
     even_squares = (x**2 for x in range(20) if x % 2 == 0)
     
-    # Nested generator
+    # Flatten nested rows
     matrix = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
-    flattened = (item for row in matrix for item in row)
+    flattened = chain.from_iterable(matrix)
     
     # Generator function
     def fibonacci_gen(n):
@@ -467,7 +475,7 @@ if __name__ == "__main__":
     
     # Complex nested expression
     data = [{"values": [1, 2, 3]}, {"values": [4, 5, 6]}]
-    total = sum(sum(item["values"]) for item in data if "values" in item)
+    total = sum([sum(item["values"]) for item in data if "values" in item])
     print(f"Complex sum: {total}")
     
     # Expression with multiple operators
@@ -2,6 +2,8 @@
 # Tests function definitions, classes, decorators, and advanced features
 
 import functools
+import inspect
+import math
 from typing import List, Dict, Optional, Union
 
 # Simple function
@@ -44,16 +46,40 @@ add_numbers = lambda a, b: a + b
 # Higher-order functions
 def apply_operation(numbers: List[int], operation):
     """Applies an operation to all numbers"""
-    return [operation(num) for num in numbers]
+    return list(map(operation, numbers))
+
+def apply_operation_np(numbers: List[int], ufunc) -> List[int]:
+    """Applies a NumPy ufunc to all numbers in one vectorized call"""
+    import numpy as np
+    return ufunc(np.asarray(numbers)).tolist()
 
 # Decorator function
 def timing_decorator(func):
     """Decorator that prints function execution info"""
+    start_msg = f"Calling {func.__name__}"
+    end_msg = f"Finished {func.__name__}"
+
+    # Inspect func itself, not what it wraps; fall back to *args/**kwargs
+    # for callables without an introspectable signature (e.g. builtins)
+    try:
+        takes_args = bool(inspect.signature(func, follow_wrapped=False).parameters)
+    except (ValueError, TypeError):
+        takes_args = True
+
+    if not takes_args:
+        @functools.wraps(func)
+        def wrapper():
+            print(start_msg)
+            result = func()
+            print(end_msg)
+            return result
+        return wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__}")
+        print(start_msg)
         result = func(*args, **kwargs)
-        print(f"Finished {func.__name__}")
+        print(end_msg)
         return result
     return wrapper
 
@@ -73,6 +99,11 @@ def repeat(times: int):
 # Decorated functions
 @timing_decorator
 def slow_operation(n: int) -> int:
+    """Sum of range(n) via the closed-form formula"""
+    return n * (n - 1) // 2 if n > 0 else 0
+
+@timing_decorator
+def slow_operation_loop(n: int) -> int:
     """A function that takes some time"""
     return sum(range(n))
 
@@ -85,6 +116,8 @@ def get_random_number() -> int:
 class Animal:
     """Base animal class"""
     
+    __slots__ = ('name', 'species', '_age', '__id')
+    
     def __init__(self, name: str, species: str):
         self.name = name
         self.species = species
@@ -130,6 +163,8 @@ class Animal:
 class Dog(Animal):
     """Dog class inheriting from Animal"""
     
+    __slots__ = ('breed',)
+    
     def __init__(self, name: str, breed: str = "Mixed"):
         super().__init__(name, "Dog")
         self.breed = breed
@@ -159,7 +194,7 @@ class Bat(Mammal, FlyingAnimal, Animal):
     """Bat with multiple inheritance"""
     
     def __init__(self, name: str):
-        Animal.__init__(self, name, "Bat")
+        super().__init__(name, "Bat")
     
     def make_sound(self) -> str:
         return "Screech!"
@@ -168,9 +203,11 @@ class Bat(Mammal, FlyingAnimal, Animal):
 class Shape:
     """Abstract shape class"""
     
+    @property
     def area(self) -> float:
         raise NotImplementedError("Subclasses must implement area method")
     
+    @property
     def perimeter(self) -> float:
         raise NotImplementedError("Subclasses must implement perimeter method")
 
@@ -178,19 +215,46 @@ class Rectangle(Shape):
     """Rectangle implementation"""
     
     def __init__(self, width: float, height: float):
-        self.width = width
-        self.height = height
+        self._width = width
+        self._height = height
+    
+    @property
+    def width(self) -> float:
+        return self._width
+    
+    @width.setter
+    def width(self, value: float):
+        self._width = value
+        self._clear_cached()
+    
+    @property
+    def height(self) -> float:
+        return self._height
+    
+    @height.setter
+    def height(self, value: float):
+        self._height = value
+        self._clear_cached()
+    
+    def _clear_cached(self):
+        """Drop cached area and perimeter after a dimension changes"""
+        self.__dict__.pop("area", None)
+        self.__dict__.pop("perimeter", None)
     
+    @functools.cached_property
     def area(self) -> float:
-        return self.width * self.height
+        return self._width * self._height
     
+    @functools.cached_property
     def perimeter(self) -> float:
-        return 2 * (self.width + self.height)
+        return 2 * (self._width + self._height)
 
 # Class with special methods
 class Counter:
     """Counter class with magic methods"""
     
+    __slots__ = ('value',)
+    
     def __init__(self, start: int = 0):
         self.value = start
     
@@ -201,12 +265,13 @@ class Counter:
         return f"Counter(start={self.value})"
     
     def __add__(self, other):
-        if isinstance(other, Counter):
+        if type(other) is Counter:
             return Counter(self.value + other.value)
         return Counter(self.value + other)
     
     def __len__(self) -> int:
-        return abs(self.value)
+        v = self.value
+        return v if v >= 0 else -v
     
     def __getitem__(self, key):
         if key == 0:
@@ -217,16 +282,18 @@ class Counter:
 class Point:
     """Point class with coordinate operations"""
     
+    __slots__ = ('x', 'y')
+    
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
     
     def distance_from_origin(self) -> float:
         """Calculate distance from origin"""
-        return (self.x ** 2 + self.y ** 2) ** 0.5
+        return math.hypot(self.x, self.y)
     
     def __eq__(self, other) -> bool:
-        if isinstance(other, Point):
+        if type(other) is Point:
             return self.x == other.x and self.y == other.y
         return False
 
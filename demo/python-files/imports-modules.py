@@ -1,20 +1,26 @@
 # Import and Module Demo
 # Tests various import styles and module structures
 
+from __future__ import annotations
+
 # Standard library imports
+import codecs
+import importlib.util
 import os
 import sys
 import json
-import datetime
+import types
 from pathlib import Path
 
-# Multiple imports from same module
-from typing import List, Dict, Optional, Union, Tuple, Any
-from collections import defaultdict, Counter, OrderedDict
+# Multiple imports from same module. Annotations are never evaluated at
+# runtime, so typing is only imported for static analysis; type checkers
+# treat a module-level TYPE_CHECKING constant as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Dict, Optional, Union, Tuple, Any
+from collections import Counter
 
-# Aliased imports
-import numpy as np
-import pandas as pd
+# Aliased imports (numpy as np and pandas as pd are loaded lazily below)
 from datetime import datetime as dt
 
 # Relative imports (would work in a package)
@@ -25,113 +31,164 @@ from datetime import datetime as dt
 # Import with star (generally discouraged but valid)
 # from math import *
 
-# Conditional imports
+# Conditional imports: probe for psutil without importing it
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+# Lazy module attributes (PEP 562): heavy imports are paid on first access
+def __getattr__(name: str):
+    if name == "np":
+        import numpy
+        globals()["np"] = numpy
+        return numpy
+    if name == "pd":
+        import pandas
+        globals()["pd"] = pandas
+        return pandas
+    if name == "psutil":
+        psutil = None
+        if HAS_PSUTIL:
+            try:
+                import psutil
+            except ImportError:
+                psutil = None
+        globals()["psutil"] = psutil
+        return psutil
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Fastest available JSON codec: orjson, then ujson, then the stdlib.
+# _json_dumps always returns UTF-8 bytes.
 try:
-    import psutil
-    HAS_PSUTIL = True
+    import orjson as _json
+
+    def _json_dumps(obj, indent=None) -> bytes:
+        return _json.dumps(obj, option=_json.OPT_INDENT_2 if indent else 0)
 except ImportError:
-    HAS_PSUTIL = False
+    try:
+        import ujson as _json
+    except ImportError:
+        _json = json
+
+    def _json_dumps(obj, indent=None) -> bytes:
+        text = _json.dumps(obj, indent=indent) if indent else _json.dumps(obj)
+        return text.encode("utf-8")
+
+_json_loads = _json.loads
+_JSONDecodeError = getattr(_json, "JSONDecodeError", ValueError)
+
+# Interpreter facts that cannot change within a process
+_PLATFORM = sys.platform
+_PYVER = sys.version
+_PYVER_INFO3 = sys.version_info[:3]
 
 # Platform-specific imports
-if sys.platform == "win32":
+if _PLATFORM == "win32":
     import winsound
-elif sys.platform.startswith("linux"):
+elif _PLATFORM.startswith("linux"):
     # Linux-specific imports would go here
     pass
 
-# Version-specific imports
-if sys.version_info >= (3, 8):
-    from typing import TypedDict, Literal
-else:
-    try:
+# Version-specific imports (static analysis only)
+if TYPE_CHECKING:
+    if sys.version_info >= (3, 8):
+        from typing import TypedDict, Literal
+    else:
         from typing_extensions import TypedDict, Literal
-    except ImportError:
-        TypedDict = dict
-        Literal = str
 
 # Global variables and constants
 VERSION = "1.0.0"
 DEBUG = True
-DEFAULT_CONFIG = {
+# Read-only, so DataProcessor instances can share it without copying
+DEFAULT_CONFIG = types.MappingProxyType({
     "timeout": 30,
     "retries": 3,
     "batch_size": 100
-}
+})
+
+# Parsed config files keyed by (absolute path, mtime_ns, size). Only flat
+# configs are cached, so a shallow copy per manager never shares state.
+_CFG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_SCALAR_TYPES = (str, int, float, bool, type(None))
 
 # Module-level constants
 PI = 3.14159265359
 E = 2.71828182846
+_CONFIG_FILENAME = "config.json"
+_REPORT_BANNER = "\n" + "=" * 50 + "\nSYSTEM REPORT\n" + "=" * 50 + "\n"
 
 # Type aliases
 UserID = int
-UserData = Dict[str, Any]
-ConfigDict = Dict[str, Union[str, int, bool]]
+if TYPE_CHECKING:
+    UserData = Dict[str, Any]
+    ConfigDict = Dict[str, Union[str, int, bool]]
 
 # Module functions
 def get_system_info() -> Dict[str, Any]:
     """Get system information using imported modules"""
     info = {
-        "platform": sys.platform,
-        "python_version": sys.version,
+        "platform": _PLATFORM,
+        "python_version": _PYVER,
         "current_time": dt.now().isoformat(),
-        "current_dir": str(Path.cwd()),
+        "current_dir": os.getcwd(),
     }
     
+    memory_usage = "psutil not available"
     if HAS_PSUTIL:
-        info["memory_usage"] = "psutil available"
-    else:
-        info["memory_usage"] = "psutil not available"
+        try:
+            import psutil
+            memory_usage = psutil.virtual_memory().percent
+        except ImportError:
+            pass
+    info["memory_usage"] = memory_usage
     
     return info
 
 def process_json_data(json_string: str) -> Dict:
     """Process JSON data using imported json module"""
     try:
-        data = json.loads(json_string)
+        data = _json_loads(json_string)
         return {
             "status": "success",
             "data": data,
-            "processed_at": datetime.datetime.now().isoformat()
+            "processed_at": dt.now().isoformat()
         }
-    except json.JSONDecodeError as e:
+    except _JSONDecodeError as e:
         return {
             "status": "error",
             "error": str(e),
-            "processed_at": datetime.datetime.now().isoformat()
+            "processed_at": dt.now().isoformat()
         }
 
 def use_collections_modules():
     """Demonstrate various collections module features"""
     
-    # defaultdict
-    word_count = defaultdict(int)
+    # Counter over the split words (counted in C)
     text = "hello world hello python world"
-    for word in text.split():
-        word_count[word] += 1
+    word_count = Counter(text.split())
     
     # Counter
     letter_count = Counter("hello world")
     
-    # OrderedDict
-    ordered = OrderedDict([("first", 1), ("second", 2), ("third", 3)])
+    # Ordered mapping (plain dicts keep insertion order since Python 3.7)
+    ordered = {"first": 1, "second": 2, "third": 3}
     
     return dict(word_count), dict(letter_count), dict(ordered)
 
 def path_operations():
     """Demonstrate pathlib operations"""
     
-    current_path = Path.cwd()
+    cwd_str = os.getcwd()
+    current_path = Path(cwd_str)
     parent_path = current_path.parent
     
-    # Path manipulation
-    config_file = current_path / "config.json"
-    backup_dir = current_path / "backups" / "2023"
+    # Path manipulation on plain strings
+    config_file = os.path.join(cwd_str, _CONFIG_FILENAME)
+    backup_dir = os.path.join(cwd_str, "backups", "2023")
     
     operations = {
-        "current": str(current_path),
+        "current": cwd_str,
         "parent": str(parent_path),
-        "config_exists": config_file.exists(),
-        "backup_dir": str(backup_dir),
+        "config_exists": os.path.isfile(config_file),
+        "backup_dir": backup_dir,
         "is_absolute": current_path.is_absolute()
     }
     
@@ -142,30 +199,36 @@ class DataProcessor:
     """Data processor using various imported modules and types"""
     
     def __init__(self, config: Optional[ConfigDict] = None):
-        self.config = config or DEFAULT_CONFIG.copy()
+        self.config = config or DEFAULT_CONFIG
         self.created_at = dt.now()
+        self._created_at_iso = self.created_at.isoformat()
         self.processed_count = 0
     
     def process_batch(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Process a batch of data"""
-        results = []
+        results = [None] * len(data)
+        batch_ts = dt.now().isoformat()
         
-        for item in data:
+        # Bind hot attributes to locals for the loop
+        process_item = self._process_item
+        count = self.processed_count
+        
+        for i, item in enumerate(data):
             try:
-                processed_item = self._process_item(item)
-                results.append({
+                results[i] = {
                     "status": "success",
-                    "data": processed_item,
-                    "timestamp": dt.now().isoformat()
-                })
-                self.processed_count += 1
+                    "data": process_item(item),
+                    "timestamp": batch_ts
+                }
+                count += 1
             except Exception as e:
-                results.append({
+                results[i] = {
                     "status": "error",
                     "error": str(e),
-                    "timestamp": dt.now().isoformat()
-                })
+                    "timestamp": batch_ts
+                }
         
+        self.processed_count = count
         return results
     
     def _process_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
@@ -173,16 +236,16 @@ class DataProcessor:
         # Simulate processing
         processed = item.copy()
         processed["processed"] = True
-        processed["processed_at"] = self.created_at.isoformat()
+        processed["processed_at"] = self._created_at_iso
         return processed
     
     def get_stats(self) -> Dict[str, Any]:
         """Get processing statistics"""
         return {
             "processed_count": self.processed_count,
-            "created_at": self.created_at.isoformat(),
+            "created_at": self._created_at_iso,
             "uptime_seconds": (dt.now() - self.created_at).total_seconds(),
-            "config": self.config
+            "config": dict(self.config)
         }
 
 # Module with nested imports and complex logic
@@ -190,29 +253,45 @@ class ConfigManager:
     """Configuration manager demonstrating module usage"""
     
     def __init__(self, config_path: Optional[str] = None):
-        self.config_path = Path(config_path) if config_path else Path("config.json")
+        self.config_path = Path(config_path) if config_path else Path(_CONFIG_FILENAME)
         self.config = {}
+        self._cache_key = None
         self.load_config()
     
     def load_config(self):
-        """Load configuration from file"""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r') as f:
-                    self.config = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}")
-                self.config = DEFAULT_CONFIG.copy()
-        else:
+        """Load configuration from file, reusing the cached parse if unchanged"""
+        self._cache_key = None
+        try:
+            st = os.stat(self.config_path)
+            key = (os.path.abspath(self.config_path), st.st_mtime_ns, st.st_size)
+            cached = _CFG_CACHE.get(key)
+            if cached is not None:
+                self._cache_key = key
+                self.config = dict(cached)
+                return
+            config = _json_loads(self.config_path.read_bytes())
+            if isinstance(config, dict) and all(
+                isinstance(value, _SCALAR_TYPES) for value in config.values()
+            ):
+                _CFG_CACHE[key] = dict(config)
+                self._cache_key = key
+            self.config = config
+        except FileNotFoundError:
+            self.config = DEFAULT_CONFIG.copy()
+        except (_JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}")
             self.config = DEFAULT_CONFIG.copy()
     
     def save_config(self):
         """Save configuration to file"""
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            self.config_path.write_bytes(_json_dumps(self.config, indent=2))
         except IOError as e:
             print(f"Error saving config: {e}")
+            return
+        if self._cache_key is not None:
+            _CFG_CACHE.pop(self._cache_key, None)
+            self._cache_key = None
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value"""
@@ -265,7 +344,7 @@ def generate_report() -> Dict[str, Any]:
             "version": VERSION,
             "debug": DEBUG,
             "has_psutil": HAS_PSUTIL,
-            "python_version": sys.version_info[:3]
+            "python_version": _PYVER_INFO3
         }
     }
     
@@ -280,11 +359,19 @@ def main():
     # Generate and display report
     report = generate_report()
     
-    # Pretty print with json
-    print("\n" + "="*50)
-    print("SYSTEM REPORT")
-    print("="*50)
-    print(json.dumps(report, indent=2))
+    # Pretty print with json: one banner write, then the encoded bytes
+    # straight to the binary buffer when the stream is UTF-8 text anyway
+    out = sys.stdout
+    out.write(_REPORT_BANNER)
+    payload = _json_dumps(report, indent=2)
+    buffer = getattr(out, "buffer", None)
+    encoding = getattr(out, "encoding", None)
+    if buffer is not None and encoding and codecs.lookup(encoding).name == "utf-8":
+        out.flush()
+        buffer.write(payload)
+    else:
+        out.write(payload.decode())
+    out.write("\n")
     
     # Demonstrate config manager
     config_mgr = ConfigManager()